@@ -11,7 +11,7 @@ from __future__ import annotations
 import logging
 import sys
 
-from .commands import parser
+from .commands import load_extensions, parser
 
 
 def setup_logging() -> None:
@@ -44,6 +44,7 @@ def main() -> int:
         The exit code.
     """
     setup_logging()
+    load_extensions()
     parser.parse()
 
     return 0
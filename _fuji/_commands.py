@@ -5,39 +5,264 @@ Commands
 This module contains the commands that are available to the user.
 
 """
+
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import logging
 import os
 import pathlib
-import random
+import shlex
+import shutil
+import signal
 import subprocess
 import sys
 import threading
 import time
-from typing import Any, Dict, Optional, overload
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    overload,
+)
 
 import clap
-import requests
 from clap.metadata import Conflicts, Short
 
-from .server import Server
-from .tmux import TmuxSession
+from fuji._core import (
+    DEFAULT_ROOT,
+    DEFAULT_ROOT_STR,
+    HTTP_TIMEOUT,
+    PaperCache,
+    config_fingerprint,
+    download,
+    http_session,
+    load_config,
+    make_subdirectories,
+    save_config,
+    update_symlink,
+    validate_server_name,
+)
+
+from .server import Server, ping_many
+from .tmux import TmuxSession, list_sessions
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
 else:
     from typing_extensions import Annotated
 
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
 __all__ = ("FujiCommands",)
 
 EDITOR = os.environ.get("EDITOR", "vim")
 PAPERMC_API_VERSION = "v2"
-DEFAULT_ROOT = pathlib.Path.home().joinpath(".fuji")
+HEALTH_CHECK_INTERVAL = 10.0  # seconds
+BOOTSTRAP_TIMEOUT = 120.0  # seconds
+LOG_WATCH_INTERVAL = 0.5  # seconds
 
 _log = logging.getLogger(__name__)
-config_file = pathlib.Path(__file__).parents[1].joinpath("config.json")
+
+def _open_in_editor(path: pathlib.Path, /) -> None:
+    """Open a file in the user's editor and wait for it to close."""
+    _log.info(f"Opening '{path}' in '{EDITOR}'.")
+    # $EDITOR may include arguments, e.g. "code --wait".
+    subprocess.run([*shlex.split(EDITOR), path.as_posix()])
+
+
+def _backoff_delay(attempt: int, /) -> float:
+    """Get the number of seconds to wait before the next polling attempt.
+
+    Parameters
+    ----------
+    attempt : int
+        The number of attempts made so far.
+
+    Returns
+    -------
+    float
+        The delay in seconds, doubling per attempt and capped at 5 seconds.
+    """
+    return min(2**attempt * 0.1, 5.0)
+
+
+async def _wait_until_online(
+    server: Server, /, *, watch_log: bool = False, timeout: float = 60.0
+) -> bool:
+    """Wait until a server is online or the timeout expires.
+
+    If the server is not online yet, `watch_log` is set, `inotify_simple`
+    is installed and the server has a logs directory, the server's log is
+    watched for the line printed once it has finished starting. Otherwise,
+    or if that line never appears, the server is polled with exponential
+    backoff.
+
+    Parameters
+    ----------
+    server : Server
+        The server to wait for.
+    watch_log : bool, optional
+        Whether the server was just started, and so will report in its log
+        when it is done starting.
+    timeout : float, optional
+        The maximum number of seconds to wait.
+
+    Returns
+    -------
+    bool
+        Whether the server came online before the timeout expired.
+    """
+    if await asyncio.to_thread(server.is_online):
+        return True
+
+    deadline = time.monotonic() + timeout
+    logs = server.path.joinpath("logs")
+
+    if watch_log and inotify_simple is not None and logs.is_dir():
+        log = logs.joinpath("latest.log")
+        stop = threading.Event()
+
+        try:
+            if await asyncio.to_thread(
+                _watch_log_until_done, log, deadline, stop
+            ):
+                return True
+        finally:
+            # If this task is cancelled (e.g., by Ctrl-C), the thread keeps
+            # running, and asyncio.run() waits for it before exiting.
+            stop.set()
+
+    # Always checked at least once, in case the log was missed but the
+    # server is up anyway.
+    attempt = 0
+    while not await asyncio.to_thread(server.is_online):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        await asyncio.sleep(min(_backoff_delay(attempt), remaining))
+        attempt += 1
+
+    return True
+
+
+async def _keep_alive(
+    server: Server,
+    tmux_session: TmuxSession,
+    command: str,
+    /,
+    *,
+    auto_reconnect: bool = False,
+) -> None:
+    """Start a server, and optionally restart it whenever it goes offline.
+
+    Parameters
+    ----------
+    server : Server
+        The server to start.
+    tmux_session : TmuxSession
+        The tmux session to run the server in.
+    command : str
+        The command that starts the server.
+    auto_reconnect : bool, optional
+        Whether to keep watching the server and restart it if it crashes.
+    """
+    while True:
+        online = await asyncio.to_thread(server.is_online)
+        started = False
+
+        if not online and not server.is_locked():
+            _log.info(
+                f"Server '{server.name}' is offline. Sending command "
+                "to start server..."
+            )
+            await asyncio.to_thread(tmux_session.send_keys, command)
+            started = True
+            server.lock.touch()
+            _log.info(f"Created lock file '{server.lock}'.")
+
+        if await _wait_until_online(server, watch_log=started):
+            _log.info(f"Server '{server.name}' is online.")
+        else:
+            _log.warning(f"Server '{server.name}' did not come online.")
+
+        server.lock.unlink(missing_ok=True)
+        _log.info(f"Removed lock file '{server.lock}'.")
+
+        if not auto_reconnect:
+            return
+
+        while await asyncio.to_thread(server.is_online):
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+
+
+def _watch_log_until_done(
+    log: pathlib.Path, deadline: float, stop: threading.Event, /
+) -> bool:
+    """Wait for the server's log to report that startup is complete.
+
+    Parameters
+    ----------
+    log : pathlib.Path
+        The server's log file.
+    deadline : float
+        The :func:`time.monotonic` time to give up at.
+    stop : threading.Event
+        Set to give up early. It is checked every `LOG_WATCH_INTERVAL`
+        seconds.
+
+    Returns
+    -------
+    bool
+        Whether the log reported that startup is complete.
+    """
+    flags = inotify_simple.flags
+    marker = b"Done ("
+    buffer = b""
+
+    try:
+        offset = log.stat().st_size
+    except FileNotFoundError:
+        offset = 0
+
+    with inotify_simple.INotify() as inotify:
+        inotify.add_watch(log.parent, flags.CREATE | flags.MODIFY)
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            if stop.is_set():
+                return False
+
+            timeout = min(remaining, LOG_WATCH_INTERVAL)
+            events = inotify.read(timeout=int(timeout * 1000))
+            events = [e for e in events if e.name == log.name]
+
+            if not events:
+                continue
+
+            # The server rotates the previous log when it starts.
+            if any(e.mask & flags.CREATE for e in events):
+                offset, buffer = 0, b""
+
+            try:
+                with log.open("rb") as f:
+                    f.seek(offset)
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+
+            offset += len(data)
+            buffer = buffer[-len(marker) :] + data
+
+            if marker in buffer:
+                return True
+
+    return False
 
 
 class FujiCommands(clap.Parser):
@@ -48,22 +273,63 @@ class FujiCommands(clap.Parser):
             "A command-line tool for managing Minecraft servers.",
             epilog="Thank you for using Fuji!",
         )
-        self.config = self.load_config()
-        self._root = self.config.get("root", DEFAULT_ROOT)
+        self._config_fingerprint: int | None = None
+        self._server_cache: dict[str, Server] = {}
+
+    @functools.cached_property
+    def config(self) -> dict[str, Any]:
+        """The contents of the configuration file, read on first access."""
+        data = self.load_config()
+        self._config_fingerprint = config_fingerprint(data)
+        return data
 
     @property
     def root(self) -> pathlib.Path:
         """The base directory of all Fuji-related files."""
-        return pathlib.Path(self._root)
+        return pathlib.Path(self.config.get("root", DEFAULT_ROOT))
 
     @root.setter
     def root(self, value: pathlib.Path) -> None:
         self.config["root"] = str(value)
 
-    @property
-    def all_servers(self) -> tuple[pathlib.Path, ...]:
-        """Get all of the servers that Fuji is managing."""
-        return tuple(self.root.joinpath("servers").iterdir())
+    def parse(
+        self,
+        argv: list[str] | None = None,
+        /,
+        help_fmt: clap.HelpFormatter | None = None,
+    ) -> None:
+        """Parse the command-line arguments and invoke the command.
+
+        The configuration file is only written if the command read it and
+        changed it.
+
+        Parameters
+        ----------
+        argv : list[str], optional
+            The command-line arguments to parse. Defaults to the value of
+            :data:`sys.argv` at the time of the call.
+        help_fmt : clap.HelpFormatter, optional
+            The help formatter to use. Defaults to a new
+            :class:`clap.HelpFormatter`.
+        """
+        argv = argv if argv is not None else sys.argv
+        help_fmt = help_fmt or clap.HelpFormatter()
+        super().parse(argv, help_fmt=help_fmt)
+
+        if "config" not in self.__dict__:
+            return
+
+        fingerprint = config_fingerprint(self.config)
+        if fingerprint != self._config_fingerprint:
+            self.save_config(self.config)
+            self._config_fingerprint = fingerprint
+
+    def iter_servers(self) -> Iterator[os.DirEntry[str]]:
+        """Iterate over all of the servers that Fuji is managing."""
+        with os.scandir(self.root.joinpath("servers")) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry
 
     def load_config(self) -> dict[str, Any]:
         """Read from the configuration file.
@@ -73,14 +339,7 @@ class FujiCommands(clap.Parser):
         dict[str, Any]
             The contents of the configuration file.
         """
-        default_data = {"root": str(DEFAULT_ROOT)}
-
-        try:
-            return json.loads(config_file.read_text())
-        except (FileNotFoundError, json.JSONDecodeError):
-            _log.warning("Failed to read configuration file.")
-            self.save_config(default_data)
-            return default_data
+        return load_config()
 
     @overload
     def save_config(self) -> None:
@@ -101,8 +360,7 @@ class FujiCommands(clap.Parser):
         if not data:
             data = self.config
 
-        with config_file.open("w") as f:
-            json.dump(data, f, indent=4)
+        save_config(data)
 
     def get_server(self, name: str, /) -> Server:
         """Convert a server name to a :class:`Server` object.
@@ -117,32 +375,62 @@ class FujiCommands(clap.Parser):
         Server
             The server object.
         """
-        return Server(ctx=self, name=name)
+        try:
+            return self._server_cache[name]
+        except KeyError:
+            server = self._server_cache[name] = Server(ctx=self, name=name)
+            return server
+
+    def _require_server(self, name: str, /) -> Server:
+        """Get an existing server by name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the server.
+
+        Returns
+        -------
+        Server
+            The server object.
+
+        Raises
+        ------
+        ValueError
+            If the name is invalid or the server does not exist.
+        """
+        name = self.validate_server_name(name)
+        server = self.get_server(name)
+
+        try:
+            server.path.stat()
+        except FileNotFoundError:
+            raise ValueError(f"Server '{name}' does not exist.") from None
+
+        return server
 
     # COMMANDS #
 
     @clap.command()
-    def setup(self, directory: pathlib.Path = DEFAULT_ROOT, /) -> None:
+    def setup(self, directory: str = DEFAULT_ROOT_STR, /) -> None:
         """Initialize Fuji for the first time.
 
         Parameters
         ----------
-        directory : pathlib.Path, optional
+        directory : str, optional
             The directory to use as the root directory for Fuji.
         """
-        path = pathlib.Path(directory)
+        path = os.path.realpath(os.path.expanduser(directory))
 
-        if path.exists():
+        if os.path.exists(path):
             _log.warning(f"Directory '{path}' already exists.")
             return
 
         _log.info(f"Initializing Fuji in '{path}'...")
 
-        directories = ("backups", "logs", "jars", "servers")
-        for directory in directories:
-            path.joinpath(directory).mkdir(parents=True, exist_ok=True)
+        make_subdirectories(path, ("backups", "logs", "jars", "servers"))
 
-        self.root = path.resolve()
+        self.root = pathlib.Path(path)
         _log.info(f"Successfully initialized Fuji in '{path}'.")
 
     # @clap.group()
@@ -153,12 +441,14 @@ class FujiCommands(clap.Parser):
     @clap.command()
     def list(self) -> None:
         """Display all available servers."""
-        if not self.all_servers:
+        entries = list(self.iter_servers())
+
+        if not entries:
             print("No servers found.")
             return
 
-        for index, server in enumerate(self.all_servers, start=1):
-            print(f"{index}. {server.name.upper()}")
+        for index, entry in enumerate(entries, start=1):
+            print(f"{index}. {entry.name.upper()}")
 
     @clap.command()
     def create(
@@ -204,8 +494,7 @@ class FujiCommands(clap.Parser):
         self.generate_eula(server, accept_eula=accept_eula)
 
         if edit:
-            _log.info(f"Opening '{server.server_properties}' in '{EDITOR}'.")
-            subprocess.run([EDITOR, server.server_properties.as_posix()])
+            _open_in_editor(server.server_properties)
 
         _log.info(f"Successfully created server '{name}'.")
 
@@ -222,10 +511,7 @@ class FujiCommands(clap.Parser):
         str
             The validated server name.
         """
-        if not name[0].isalpha():
-            raise ValueError(f"'{name}' is not a valid server name.")
-
-        return name.lower()
+        return validate_server_name(name)
 
     def generate_eula(
         self, /, server: Server, accept_eula: bool = False
@@ -240,14 +526,31 @@ class FujiCommands(clap.Parser):
             Whether to accept the EULA without prompting the user.
         """
         cmd = ["java", "-jar", server.server_jar.as_posix(), "--nogui"]
-        subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            shell=False,
             cwd=server.path,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
 
+        try:
+            process.wait(timeout=BOOTSTRAP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+            raise RuntimeError(
+                f"Server '{server.name}' took too long to generate its files."
+            ) from None
+        except BaseException:
+            # e.g., KeyboardInterrupt. The bootstrap runs in its own session,
+            # so it would not receive the signal and would be left behind.
+            if process.poll() is None:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+
+            raise
+
         if not accept_eula:
             response = input(
                 "Please read the Minecraft EULA before continuing:\n"
@@ -274,13 +577,10 @@ class FujiCommands(clap.Parser):
         assume_yes : bool, optional
             Whether to skip the confirmation prompt.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
+        server = self._require_server(name)
+        name = server.name
         _log.info(f"Deleting server '{name}' at '{server.path}'...")
 
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
-
         if not assume_yes:
             response = input(
                 f"Are you sure you want to delete '{name}'? [y/N] "
@@ -288,7 +588,7 @@ class FujiCommands(clap.Parser):
             if response.lower() not in ("y", "yes"):
                 return
 
-        subprocess.run(["rm", "-rf", server.path.as_posix()])
+        shutil.rmtree(server.path)
         _log.info(f"Successfully deleted server '{name}'.")
 
     @clap.command()
@@ -300,14 +600,8 @@ class FujiCommands(clap.Parser):
         name : str
             The name of the server to edit.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
-
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
-
-        _log.info(f"Opening '{server.server_properties}' in '{EDITOR}'.")
-        subprocess.run([EDITOR, server.server_properties.as_posix()])
+        server = self._require_server(name)
+        _open_in_editor(server.server_properties)
 
     @clap.command()
     def start(
@@ -326,20 +620,16 @@ class FujiCommands(clap.Parser):
         auto_reconnect : bool, optional
             Whether to automatically reconnect to the server if it crashes.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
-
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
+        server = self._require_server(name)
+        name = server.name
 
         tmux_session = TmuxSession(f"fuji-{name}")
-        if not tmux_session.exists():
-            tmux_session.new()
+        tmux_session.new()
 
         # Aikar's flags for optimizing the JVM: https://mcflags.emc.gs
         cmd = [
             "cd",
-            server.path.resolve().as_posix(),
+            server.resolved_path.as_posix(),
             "&&",
             "java",
             "-Xms5G",
@@ -365,40 +655,21 @@ class FujiCommands(clap.Parser):
             "-Dusing.aikars.flags=https://mcflags.emc.gs",
             "-Daikars.new.flags=true",
             "-jar",
-            server.server_jar.resolve().as_posix(),
+            server.resolved_jar.as_posix(),
             "--nogui",
         ]
 
-        def watch_server() -> None:
-            while 1:
-                retries = 20
-                if not server.is_online() and not server.is_locked():
-                    _log.info(
-                        f"Server '{name}' is offline. Sending command "
-                        "to start server..."
-                    )
-                    tmux_session.send_keys(" ".join(cmd))
-                    server.lock.touch()
-                    _log.info(f"Created lock file '{server.lock}'.")
-
-                while not server.is_online() and retries > 0:
-                    retries -= 1
-                    seconds = 1.0 + (random.randint(10, 100) / 100)
-                    time.sleep(seconds)
-
-                _log.info(f"Server '{name}' is online.")
-                os.remove(server.lock)
-                _log.info(f"Removed lock file '{server.lock}'.")
-
-                if not auto_reconnect:
-                    break
-
         try:
-            # TODO: Does this leave a zombie process if auto_reconnect is true?
-            thread = threading.Thread(target=watch_server, daemon=False)
-            thread.start()
+            asyncio.run(
+                _keep_alive(
+                    server,
+                    tmux_session,
+                    " ".join(cmd),
+                    auto_reconnect=auto_reconnect,
+                )
+            )
         except KeyboardInterrupt:
-            os.remove(server.lock)
+            server.lock.unlink(missing_ok=True)
             _log.info(f"Removed lock file '{server.lock}'.")
 
     @clap.command()
@@ -410,47 +681,65 @@ class FujiCommands(clap.Parser):
         name : str
             The name of the server to stop.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
+        server = self._require_server(name)
+        name = server.name
         tmux_session = TmuxSession(f"fuji-{name}")
 
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
-
-        if not tmux_session.exists():
+        if not tmux_session.exists_in(list_sessions()):
             raise RuntimeError(f"Server '{name}' is not running.")
 
         tmux_session.send_keys("stop")
         _log.info(f"Sent command to stop server '{name}'.")
 
-        retries = 10
-        while server.is_online() and retries > 0:
-            retries -= 1
-            time.sleep(1)
+        attempt = 0
+        deadline = time.monotonic() + 10
+        while server.is_online() and time.monotonic() < deadline:
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
 
         _log.info(f"Server '{name}' is offline.")
         tmux_session.kill()
         _log.info(f"Killed tmux session '{tmux_session.name}'.")
 
     @clap.command()
-    def status(self, name: str, /) -> None:
-        """Display the status of a Minecraft server.
+    def status(self, name: str | None = None, /) -> None:
+        """Display the status of one or all Minecraft servers.
 
         Parameters
         ----------
-        name : str
-            The name of the server to check.
+        name : str, optional
+            The name of the server to check. If not specified, all servers
+            are checked at once.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
+        if name is not None:
+            server = self._require_server(name)
+            servers = {server.name: server.is_online()}
+        else:
+            addresses: dict[str, tuple[str, int] | None] = {}
 
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
+            for entry in self.iter_servers():
+                try:
+                    address = self.get_server(entry.name).get_address()
+                except OSError as exc:
+                    # e.g., the server has no server.properties yet. Like
+                    # `Server.is_online`, report it as offline.
+                    _log.warning(f"Unable to read '{entry.name}': {exc}")
+                    address = None
 
-        if server.is_online():
-            print(f"Server '{name}' is online.")
-        else:
-            print(f"Server '{name}' is offline.")
+                addresses[entry.name] = address
+
+            online = ping_many(a for a in addresses.values() if a is not None)
+            servers = {
+                k: v is not None and online[v] for k, v in addresses.items()
+            }
+
+        if not servers:
+            print("No servers found.")
+            return
+
+        for server_name, is_online in servers.items():
+            state = "online" if is_online else "offline"
+            print(f"Server '{server_name}' is {state}.")
 
     @clap.command()
     def migrate(self, name: str, directory: pathlib.Path, /) -> None:
@@ -498,11 +787,8 @@ class FujiCommands(clap.Parser):
         url : str, optional
             The URL to download the plugin from.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
-
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
+        server = self._require_server(name)
+        name = server.name
 
         plugin = server.path.joinpath("plugins", filename)
 
@@ -512,7 +798,8 @@ class FujiCommands(clap.Parser):
                 raise ValueError(f"Plugin '{plugin}' does not exist.")
             plugin_data = local_plugin.read_bytes()
         elif url is not None:
-            if (response := requests.get(url)).status_code != 200:
+            response = http_session().get(url, timeout=HTTP_TIMEOUT)
+            if response.status_code != 200:
                 raise RuntimeError(
                     f"Failed to download plugin: {response.text}"
                 )
@@ -544,30 +831,24 @@ class FujiCommands(clap.Parser):
         build : int, optional
             The build number of PaperMC to update to.
         """
-        name = self.validate_server_name(name)
-        server = self.get_server(name)
+        server = self._require_server(name)
+        name = server.name
 
-        if not server.path.exists():
-            raise ValueError(f"Server '{name}' does not exist.")
-
-        filename, data = self.get_paper_jar(version=version, build=build)
-        if server.server_jar.resolve().name != filename:
-            paper_jar = self.root.joinpath("jars", filename)
-            _log.info(f"Writing bytes to '{paper_jar}'.")
-            paper_jar.write_bytes(data)
+        _, paper_jar = self.get_paper_jar(version=version, build=build)
 
+        if update_symlink(server.server_jar, paper_jar):
             _log.info(f"Symlink '{server.server_jar}' -> '{paper_jar}'.")
-            if server.server_jar.exists():
-                server.server_jar.unlink()
-            server.server_jar.symlink_to(paper_jar)
 
         _log.info(f"Successfully upgraded server '{name}'.")
 
     def get_paper_jar(
         self, version: str | None = None, build: int | None = None
-    ) -> tuple[str, bytes]:
+    ) -> tuple[str, pathlib.Path]:
         """Get the PaperMC server JAR file for the specified version and build.
 
+        The JAR file is downloaded into the ``jars`` directory if it is not
+        already there.
+
         Parameters
         ----------
         version : str, optional
@@ -579,37 +860,32 @@ class FujiCommands(clap.Parser):
 
         Returns
         -------
-        tuple[str, bytes]
-            A tuple containing the filename of the downloaded JAR file and the
-            contents of the JAR file.
+        tuple[str, pathlib.Path]
+            A tuple containing the filename of the JAR file and its path.
 
         Raises
         ------
         RuntimeError
             If the server JAR file could not be downloaded.
         """
+        if version is not None and build is not None:
+            cached = self.root.joinpath("jars", f"paper-{version}-{build}.jar")
+            if cached.exists():
+                _log.info("PaperMC is already up-to-date.")
+                return cached.name, cached
+
         url = f"https://papermc.io/api/{PAPERMC_API_VERSION}/projects/paper"
 
         if version is None:
-            if (response := requests.get(url)).status_code != 200:
-                raise RuntimeError(
-                    f"Failed to get latest version of PaperMC: {response.text}"
-                )
-            version = response.json()["versions"][-1]
-
-        url += f"/versions/{version}/builds"
-
-        if (response := requests.get(url)).status_code != 200:
-            raise RuntimeError(
-                f"Failed to get latest build of PaperMC: {response.text}"
-            )
+            version, builds = asyncio.run(self._get_latest_paper_builds(url))
+            url += f"/versions/{version}/builds"
+        else:
+            url += f"/versions/{version}/builds"
+            builds = self.get_paper_metadata(url)["builds"]
 
         if build is None:
-            data = response.json()["builds"][-1]
+            data = builds[-1]
         else:
-            temp = response.json()
-            builds = temp["builds"]
-
             valid_build = False
             for b in builds:
                 if b["build"] == build:
@@ -625,16 +901,78 @@ class FujiCommands(clap.Parser):
         build = build or data["build"]
         filename: str = data["downloads"]["application"]["name"]
 
-        for f in self.root.joinpath("jars").iterdir():
-            if f.name == filename:
-                _log.info("PaperMC is already up-to-date.")
-                return filename, f.read_bytes()
+        paper_jar = self.root.joinpath("jars", filename)
+        if paper_jar.exists():
+            _log.info("PaperMC is already up-to-date.")
+            return filename, paper_jar
 
         url += f"/{build}/downloads/{filename}"
 
         _log.info(f"Downloading PaperMC {version} build {build}...")
-        if (response := requests.get(url)).status_code != 200:
-            raise RuntimeError(f"Failed to download PaperMC: {response.text}")
-
+        download(url, paper_jar)
         _log.info("Download complete.")
-        return filename, response.content
+        return filename, paper_jar
+
+    async def _get_latest_paper_builds(
+        self, url: str, /
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Get the latest version of PaperMC and its builds.
+
+        The builds of the latest version seen last time are requested at the
+        same time as the list of versions, which saves a round-trip whenever
+        the latest version has not changed since.
+        """
+        cached = PaperCache(self.root).peek(url)
+
+        try:
+            guess = cached["versions"][-1] if cached is not None else None
+        except (KeyError, IndexError):
+            guess = None
+
+        if guess is None:
+            project = await asyncio.to_thread(self.get_paper_metadata, url)
+        else:
+            project, prefetched = await asyncio.gather(
+                asyncio.to_thread(self.get_paper_metadata, url),
+                asyncio.to_thread(
+                    self.get_paper_metadata,
+                    f"{url}/versions/{guess}/builds",
+                ),
+                return_exceptions=True,
+            )
+
+            if isinstance(project, BaseException):
+                raise project
+
+        version: str = project["versions"][-1]
+
+        if version == guess and not isinstance(prefetched, BaseException):
+            return version, prefetched["builds"]
+
+        builds = await asyncio.to_thread(
+            self.get_paper_metadata, f"{url}/versions/{version}/builds"
+        )
+        return version, builds["builds"]
+
+    def get_paper_metadata(self, url: str, /) -> dict[str, Any]:
+        """Get a JSON response from PaperMC's API, using the local cache.
+
+        See :class:`fuji._core.PaperCache` for how long responses are
+        cached for.
+
+        Parameters
+        ----------
+        url : str
+            The API endpoint to query.
+
+        Returns
+        -------
+        dict[str, Any]
+            The decoded JSON response.
+
+        Raises
+        ------
+        RuntimeError
+            If the request failed and there is no cached response.
+        """
+        return PaperCache(self.root).get(url)
@@ -9,5 +9,8 @@ extensions = [
     ".fuji",
 ]
 
-for ext in extensions:
-    parser.add_extension(ext, package="fuji.ext")
+
+def load_extensions() -> None:
+    """Load the extensions that define the commands."""
+    for ext in extensions:
+        parser.add_extension(ext, package="fuji.ext")
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-import json
 import logging
 import pathlib
 from typing import TYPE_CHECKING, overload
 
 import clap
 
+from fuji._core import (
+    CONFIG_FILE,
+    DEFAULT_ROOT,
+    DEFAULT_ROOT_STR,
+    load_config,
+    make_subdirectories,
+    save_config,
+)
+
 if TYPE_CHECKING:
     from builtins import dict as Dict
     from typing import Any, Optional
@@ -23,8 +31,9 @@ _log = logging.getLogger(__name__)
 class FujiCommands(clap.Extension):
     """Commands related to the Fuji directory and configuration."""
 
-    DEFAULT_ROOT = pathlib.Path.home().joinpath(".fuji")
-    CONFIG_FILE = pathlib.Path(__file__).parents[2].joinpath("config.json")
+    DEFAULT_ROOT = DEFAULT_ROOT
+    DEFAULT_ROOT_STR = DEFAULT_ROOT_STR
+    CONFIG_FILE = CONFIG_FILE
 
     def __init__(self) -> None:
         self.config = self.load_config()
@@ -47,14 +56,7 @@ class FujiCommands(clap.Extension):
         dict[str, Any]
             The contents of the configuration file.
         """
-        default_data = {"root": str(self.DEFAULT_ROOT)}
-
-        try:
-            return json.loads(self.CONFIG_FILE.read_text())
-        except (FileNotFoundError, json.JSONDecodeError):
-            _log.warning("Failed to read configuration file.")
-            self.save_config(default_data)
-            return default_data
+        return load_config()
 
     @overload
     def save_config(self) -> None:
@@ -75,11 +77,10 @@ class FujiCommands(clap.Extension):
         if not data:
             data = self.config
 
-        with self.CONFIG_FILE.open("w") as f:
-            json.dump(data, f, indent=4)
+        save_config(data)
 
     @clap.command()
-    def init(self, directory: str = str(DEFAULT_ROOT), /) -> None:
+    def init(self, directory: str = DEFAULT_ROOT_STR, /) -> None:
         """Setup the Fuji directory.
 
         Parameters
@@ -94,13 +95,7 @@ class FujiCommands(clap.Extension):
             return
 
         _log.info(f"Initializing Fuji directory at '{root}'.")
-        directories = ("backups", "logs", "jars", "servers")
-
-        for d in directories:
-            assert root.joinpath(d).exists() is False
-            subdirectory = root.joinpath(d)
-            _log.debug(f"Creating subdirectory '{subdirectory}'.")
-            subdirectory.mkdir(parents=True)
+        make_subdirectories(root, ("backups", "logs", "jars", "servers"))
 
         self.root = root
         _log.info(f"Fuji directory initialized at '{root}'.")
@@ -7,10 +7,19 @@ This module contains the implementation of the :class:`Server` class.
 """
 from __future__ import annotations
 
+import errno
 import logging
 import pathlib
+import selectors
 import socket
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from fuji.server_properties import (
+    ServerProperties,
+    deserialize_server_properties,
+)
 
 if TYPE_CHECKING:
     from .commands import FujiCommands
@@ -18,52 +27,55 @@ if TYPE_CHECKING:
 _log = logging.getLogger(__name__)
 
 
+@dataclass(eq=False, slots=True)
 class Server:
     """Represents a Minecraft server managed by Fuji."""
 
-    def __init__(self, ctx: FujiCommands, name: str) -> None:
-        self.ctx = ctx
-        self.name = name
-        self._ip_address: str | None = None
-        self._port: int | None = None
-
-    @property
-    def path(self) -> pathlib.Path:
-        """The path to the server's directory."""
-        return self.ctx.root.joinpath("servers", self.name)
-
-    @property
-    def lock(self) -> pathlib.Path:
-        """The path to the server's lock file."""
-        return self.path.joinpath(".lock")
-
-    @property
-    def server_jar(self) -> pathlib.Path:
-        """The path to the server's JAR file."""
-        return self.path.joinpath("server.jar")
+    ctx: FujiCommands = field(repr=False)
+    name: str
+    ip_address: str | None = None
+    port: int | None = None
+
+    #: The path to the server's directory.
+    path: pathlib.Path = field(init=False)
+    #: The path to the server's lock file.
+    lock: pathlib.Path = field(init=False, repr=False)
+    #: The path to the server's JAR file.
+    server_jar: pathlib.Path = field(init=False, repr=False)
+    #: The path to the server's server.properties file.
+    server_properties: pathlib.Path = field(init=False, repr=False)
+
+    _resolved_path: pathlib.Path | None = field(
+        default=None, init=False, repr=False
+    )
+    _resolved_jar: pathlib.Path | None = field(
+        default=None, init=False, repr=False
+    )
+    _properties: tuple[int, ServerProperties] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.path = path = self.ctx.root.joinpath("servers", self.name)
+        self.lock = path.joinpath(".lock")
+        self.server_jar = path.joinpath("server.jar")
+        self.server_properties = path.joinpath("server.properties")
 
     @property
-    def server_properties(self) -> pathlib.Path:
-        """The path to the server's server.properties file."""
-        return self.path.joinpath("server.properties")
+    def resolved_path(self) -> pathlib.Path:
+        """The absolute path to the server's directory."""
+        if self._resolved_path is None:
+            self._resolved_path = self.path.resolve()
 
-    @property
-    def ip_address(self) -> str:
-        """The IP address of the server."""
-        return self._ip_address
-
-    @ip_address.setter
-    def ip_address(self, value: str) -> None:
-        self._ip_address = value
+        return self._resolved_path
 
     @property
-    def port(self) -> int:
-        """The port of the server."""
-        return self._port
+    def resolved_jar(self) -> pathlib.Path:
+        """The absolute path to the JAR file the server's JAR links to."""
+        if self._resolved_jar is None:
+            self._resolved_jar = self.server_jar.resolve()
 
-    @port.setter
-    def port(self, value: int) -> None:
-        self._port = value
+        return self._resolved_jar
 
     def is_locked(self) -> bool:
         """Whether the server is currently locked."""
@@ -77,32 +89,33 @@ class Server:
         tuple[str, int]
             A tuple containing the IP address and port of the server.
         """
-        if self.ip_address is not None and self.port is not None:
-            return self.ip_address, self.port
-
-        ip_address, port = "127.0.0.1", 25565
-        n = len((ip_address, port))
-
-        with self.server_properties.open() as f:
-            for line in f:
-                if line.startswith("server-ip="):
-                    ip_address = line.split("=")[1]
-                    print(ip_address)
-                    n -= 1
-                elif line.startswith("server-port="):
-                    temp = line.split("=")[1]
-                    if temp.isnumeric():
-                        port = int(temp)
-                    n -= 1
-                else:
-                    continue
-
-                if n < 1:
-                    break
+        properties = self.get_properties()
+        ip_address = properties.get("server-ip") or "127.0.0.1"
+        port = properties.get("server-port") or 25565
 
         self.ip_address, self.port = ip_address, port
         return ip_address, port
 
+    def get_properties(self) -> ServerProperties:
+        """Get the contents of the server's server.properties file.
+
+        The file is only parsed again if it was modified since the last call.
+
+        Returns
+        -------
+        ServerProperties
+            The parsed server.properties file.
+        """
+        mtime = self.server_properties.stat().st_mtime_ns
+
+        if self._properties is None or self._properties[0] != mtime:
+            with self.server_properties.open() as file:
+                properties = deserialize_server_properties(file)
+
+            self._properties = (mtime, properties)
+
+        return self._properties[1]
+
     def is_online(self) -> bool:
         """Whether the server is currently online."""
         try:
@@ -110,3 +123,67 @@ class Server:
                 return True
         except OSError:
             return False
+
+
+def ping_many(
+    addresses: Iterable[tuple[str, int]], /, *, timeout: float = 1.0
+) -> dict[tuple[str, int], bool]:
+    """Check which addresses accept a TCP connection.
+
+    All of the connections are attempted at once using non-blocking sockets,
+    so checking many addresses takes about as long as checking one.
+
+    Parameters
+    ----------
+    addresses : Iterable[tuple[str, int]]
+        The addresses to check, as ``(host, port)`` pairs.
+    timeout : float, optional
+        The maximum number of seconds to wait for all of the connections.
+
+    Returns
+    -------
+    dict[tuple[str, int], bool]
+        A mapping of each address to whether a connection could be made.
+    """
+    results: dict[tuple[str, int], bool] = {}
+
+    with selectors.DefaultSelector() as selector:
+        for address in addresses:
+            results[address] = False
+
+            try:
+                family, type_, proto, _, sockaddr = socket.getaddrinfo(
+                    *address, type=socket.SOCK_STREAM
+                )[0]
+                sock = socket.socket(family, type_, proto)
+            except OSError:
+                continue
+
+            sock.setblocking(False)
+            error = sock.connect_ex(sockaddr)
+
+            if error in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                selector.register(sock, selectors.EVENT_WRITE, address)
+            else:
+                results[address] = error == 0
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            for key, _ in selector.select(remaining):
+                sock = key.fileobj
+                error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                results[key.data] = error == 0
+                selector.unregister(sock)
+                sock.close()
+
+        for key in list(selector.get_map().values()):
+            selector.unregister(key.fileobj)
+            key.fileobj.close()
+
+    return results
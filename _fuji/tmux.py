@@ -12,6 +12,28 @@ import subprocess
 from typing import Any
 
 
+def list_sessions() -> set[str]:
+    """Get the names of all tmux sessions with a single tmux call.
+
+    Returns
+    -------
+    set[str]
+        The session names. Empty if the tmux server is not running.
+    """
+    result = subprocess.run(
+        ["tmux", "list-sessions", "-F", "#{session_name}"],
+        shell=False,
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        return set()
+
+    return set(result.stdout.splitlines())
+
+
 class TmuxSession:
     """Represents a tmux session.
 
@@ -38,50 +60,102 @@ class TmuxSession:
         else:
             return True
 
+    def exists_in(self, names: set[str], /) -> bool:
+        """Check that the session is in a set of session names.
+
+        Parameters
+        ----------
+        names : set[str]
+            The session names, as returned by :func:`list_sessions`.
+        """
+        return self.name in names
+
     def new(self) -> None:
         """Create a new tmux session."""
-        if self.exists():
-            self._log.warning(f"Session '{self.name}' already exists.")
-            return
-
-        _ = subprocess.run(
+        result = subprocess.run(
             ["tmux", "new-session", "-d", "-s", self.name],
             shell=False,
+            check=False,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )
+
+        if result.returncode != 0:
+            if result.stderr.startswith("duplicate session"):
+                self._log.warning(f"Session '{self.name}' already exists.")
+            else:
+                self._log.error(
+                    f"Failed to create session '{self.name}': "
+                    f"{result.stderr.strip()}"
+                )
+            return
+
         self._log.info(f"Created new session: '{self.name}'")
 
     def kill(self) -> None:
         """Kill the tmux session."""
-        if not self.exists():
-            self._log.warning(f"Session '{self.name}' does not exist.")
-            return
-
-        _ = subprocess.run(
+        result = subprocess.run(
             ["tmux", "kill-session", "-t", self.name],
             shell=False,
+            check=False,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
+
+        if result.returncode != 0:
+            self._log.warning(f"Session '{self.name}' does not exist.")
+            return
+
         self._log.info(f"Killed session: '{self.name}'")
 
     def send_keys(
         self, command: str, enter: bool = True, **params: Any
     ) -> None:
         """Send a command to the tmux session."""
-        if not self.exists():
+        params.setdefault("shell", False)
+        params.setdefault("check", False)
+        params.setdefault("stderr", subprocess.PIPE)
+        cmd = ["tmux", "send-keys", "-t", self.name, command]
+
+        if enter:
+            cmd.append("Enter")
+
+        result = subprocess.run(cmd, **params)
+
+        if result.returncode != 0:
             self._log.warning(f"Session '{self.name}' does not exist.")
             return
 
-        params.setdefault("shell", False)
-        cmd = [
-            "tmux",
-            "send-keys",
-            "-t",
-            self.name,
-            command,
-            "Enter" if enter else "",
-        ]
-        _ = subprocess.run(cmd, **params)
         self._log.info(f"Sent command to session '{self.name}': '{command}'")
+
+    def send_keys_many(self, commands: list[str], **params: Any) -> None:
+        """Send multiple commands to the tmux session in a single call.
+
+        Each command is followed by an ``Enter`` key press.
+
+        Parameters
+        ----------
+        commands : list[str]
+            The commands to send, in order.
+        """
+        if not commands:
+            return
+
+        params.setdefault("shell", False)
+        params.setdefault("check", False)
+        params.setdefault("stderr", subprocess.PIPE)
+        cmd = ["tmux", "send-keys", "-t", self.name]
+
+        for command in commands:
+            cmd.extend((command, "Enter"))
+
+        result = subprocess.run(cmd, **params)
+
+        if result.returncode != 0:
+            self._log.warning(f"Session '{self.name}' does not exist.")
+            return
+
+        self._log.info(
+            f"Sent {len(commands)} commands to session '{self.name}'."
+        )
@@ -18,8 +18,11 @@ extensions = [
     ".commands",
 ]
 
-for extension in extensions:
-    parser.extend(extension, package="fuji")
+
+def load_extensions() -> None:
+    """Load the extensions that define the commands."""
+    for extension in extensions:
+        parser.extend(extension, package="fuji")
 
 
 def logging_setup() -> None:
@@ -45,6 +48,7 @@ def logging_setup() -> None:
 
 def main() -> int:
     logging_setup()
+    load_extensions()
     parser.parse()
 
     return 0
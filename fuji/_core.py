@@ -0,0 +1,576 @@
+from __future__ import annotations
+
+import copy
+import functools
+import json
+import logging
+import os
+import pathlib
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from . import __version__
+
+try:
+    import orjson
+except ImportError:
+    _HAVE_ORJSON = False
+else:
+    _HAVE_ORJSON = True
+
+if TYPE_CHECKING:
+    import requests
+
+# fmt: off
+__all__ = (
+    "CONFIG_FILE",
+    "DEFAULT_ROOT",
+    "DEFAULT_ROOT_STR",
+    "HTTP_TIMEOUT",
+    "PAPER_CACHE_TTL",
+    "PaperCache",
+    "config_fingerprint",
+    "download",
+    "dumps",
+    "http_session",
+    "load_config",
+    "loads",
+    "make_subdirectories",
+    "max_age",
+    "read_json",
+    "replace_symlink",
+    "save_config",
+    "update_symlink",
+    "validate_server_name",
+    "write_json",
+)
+# fmt: on
+
+DEFAULT_ROOT = pathlib.Path.home().joinpath(".fuji")
+DEFAULT_ROOT_STR = str(DEFAULT_ROOT)
+CONFIG_FILE = pathlib.Path(__file__).parents[1].joinpath("config.json")
+PAPER_CACHE_TTL = 300  # seconds, unless PaperMC specifies otherwise
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+_log = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age=(\d+)")
+
+# Guards the read-modify-write of the PaperMC cache, which may be updated
+# from several threads at once.
+_paper_cache_lock = threading.Lock()
+
+# The configuration last read or written, as ``(key, content, data)`` where
+# ``key`` is the file's modification time and size at the time.
+_config_cache: tuple[tuple[int, int] | None, bytes, dict[str, Any]] | None
+_config_cache = None
+
+
+def dumps(data: Any, /) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Parameters
+    ----------
+    data : Any
+        The object to serialize.
+
+    Returns
+    -------
+    bytes
+        The serialized object, without any insignificant whitespace.
+    """
+    if _HAVE_ORJSON:
+        return orjson.dumps(data)
+
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str, /) -> Any:
+    """Deserialize a JSON document.
+
+    Parameters
+    ----------
+    data : bytes | str
+        The document to deserialize.
+
+    Returns
+    -------
+    Any
+        The deserialized object.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the document is not valid JSON.
+    """
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def read_json(path: pathlib.Path, /) -> Any:
+    """Read and deserialize a JSON file."""
+    return loads(path.read_bytes())
+
+
+def write_json(path: pathlib.Path, data: Any, /) -> None:
+    """Serialize an object and write it to a JSON file."""
+    _replace_file(path, dumps(data))
+
+
+def _replace_file(path: pathlib.Path, content: bytes, /) -> None:
+    """Atomically replace the contents of a file.
+
+    The content is written to a temporary file next to ``path``, which is
+    then renamed over it, so readers never see a partially written file.
+    """
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+def make_subdirectories(
+    root: str | os.PathLike[str], names: Iterable[str], /
+) -> None:
+    """Create a directory and the given subdirectories inside it.
+
+    The subdirectories are created relative to a file descriptor for the
+    directory, so its path is only resolved once.
+
+    Parameters
+    ----------
+    root : str | os.PathLike[str]
+        The directory to create. Its parents are created as needed.
+    names : Iterable[str]
+        The names of the subdirectories to create.
+
+    Raises
+    ------
+    FileExistsError
+        If one of the subdirectories already exists.
+    """
+    os.makedirs(root, exist_ok=True)
+
+    if os.mkdir not in os.supports_dir_fd:
+        for name in names:
+            os.mkdir(os.path.join(root, name))
+        return
+
+    fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name in names:
+            os.mkdir(name, dir_fd=fd)
+    finally:
+        os.close(fd)
+
+
+def replace_symlink(link: pathlib.Path, target: pathlib.Path, /) -> None:
+    """Point a symlink at a new target, creating it if it does not exist.
+
+    The new symlink is created under a temporary name and renamed over the
+    old one, so ``link`` never stops existing in between.
+
+    Parameters
+    ----------
+    link : pathlib.Path
+        The path of the symlink.
+    target : pathlib.Path
+        The path the symlink should point to.
+    """
+    tmp = link.with_name(f"{link.name}.new")
+    tmp.unlink(missing_ok=True)
+    os.symlink(target, tmp)
+    os.replace(tmp, link)
+
+
+def update_symlink(link: pathlib.Path, target: pathlib.Path, /) -> bool:
+    """Point a symlink at a new target, unless it already points there.
+
+    Parameters
+    ----------
+    link : pathlib.Path
+        The path of the symlink.
+    target : pathlib.Path
+        The path the symlink should point to.
+
+    Returns
+    -------
+    bool
+        Whether the symlink was replaced.
+    """
+    # Only the immediate symlink target is needed, not a full resolve.
+    try:
+        current = os.readlink(link)
+    except OSError:
+        current = None
+
+    if current == os.fspath(target):
+        return False
+
+    replace_symlink(link, target)
+    return True
+
+
+def _config_key() -> tuple[int, int] | None:
+    """Get the key used to detect changes to the configuration file."""
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return None
+
+    return st.st_mtime_ns, st.st_size
+
+
+def load_config() -> dict[str, Any]:
+    """Read from the configuration file.
+
+    The file is only read and decoded again if its modification time or
+    size changed since it was last read or written. If the file is missing
+    or invalid, it is replaced with the default configuration.
+
+    Returns
+    -------
+    dict[str, Any]
+        The contents of the configuration file.
+    """
+    global _config_cache
+    key = _config_key()
+
+    if key is not None and _config_cache is not None:
+        if _config_cache[0] == key:
+            return copy.deepcopy(_config_cache[2])
+
+    try:
+        # A single fstat() and read() instead of the extra lseek(), fstat()
+        # and read() calls made by a buffered file object.
+        fd = os.open(CONFIG_FILE, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            content = os.read(fd, st.st_size + 1)
+        finally:
+            os.close(fd)
+
+        data = loads(content)
+    except (FileNotFoundError, json.JSONDecodeError):
+        _log.warning("Failed to read configuration file.")
+        default_data = {"root": DEFAULT_ROOT_STR}
+        save_config(default_data)
+        return default_data
+
+    _config_cache = ((st.st_mtime_ns, st.st_size), content, data)
+    return copy.deepcopy(data)
+
+
+def save_config(data: dict[str, Any], /) -> None:
+    """Write to the configuration file.
+
+    The file is left untouched if its contents would not change.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        The data to write to the configuration file.
+    """
+    global _config_cache
+    content = dumps(data)
+    key = _config_key()
+
+    if key is not None:
+        if _config_cache is not None and _config_cache[0] == key:
+            unchanged = _config_cache[1] == content
+        else:
+            unchanged = CONFIG_FILE.read_bytes() == content
+
+        if unchanged:
+            return
+
+    _replace_file(CONFIG_FILE, content)
+    _config_cache = (_config_key(), content, copy.deepcopy(data))
+
+
+def config_fingerprint(data: dict[str, Any], /) -> int:
+    """Get a value that changes whenever the configuration changes.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        The configuration data.
+
+    Returns
+    -------
+    int
+        A hash of the serialized configuration.
+    """
+    return hash(dumps(data))
+
+
+def validate_server_name(name: str, /) -> str:
+    """Validate a server name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the server.
+
+    Returns
+    -------
+    str
+        The validated server name.
+
+    Raises
+    ------
+    ValueError
+        If the name does not start with a letter.
+    """
+    if not name[:1].isalpha():
+        raise ValueError(f"'{name}' is not a valid server name.")
+
+    return name.lower()
+
+
+def max_age(headers: Mapping[str, str], /) -> int | None:
+    """Get how long a response may be cached for, from its headers.
+
+    Parameters
+    ----------
+    headers : Mapping[str, str]
+        The headers of the response.
+
+    Returns
+    -------
+    int | None
+        The number of seconds the response may be cached for. This is ``0``
+        if it must not be cached, or None if the headers do not say.
+    """
+    cache_control = headers.get("Cache-Control", "").lower()
+
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def http_session() -> requests.Session:
+    """Get the HTTP session shared by all requests.
+
+    Reusing one session keeps connections alive between requests.
+    `requests` is imported on first use, since most commands never make a
+    request.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["User-Agent"] = f"fuji/{__version__}"
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,  # Enough for several plugin downloads at once.
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download(
+    url: str, path: pathlib.Path, /, *, etag: str | None = None
+) -> tuple[bool, str | None]:
+    """Stream a file to disk without holding it in memory.
+
+    The file is written next to `path` and renamed once complete, so an
+    interrupted download is never mistaken for a finished one. When the
+    size is known up front, the space for the file is allocated in one go.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file to download.
+    path : pathlib.Path
+        The path to save the file to.
+    etag : str, optional
+        The ETag of the file already at `path`. If the server reports the
+        file is unchanged, nothing is downloaded.
+
+    Returns
+    -------
+    tuple[bool, str | None]
+        Whether the file was downloaded, and its ETag, if any.
+
+    Raises
+    ------
+    RuntimeError
+        If the file could not be downloaded in full.
+    """
+    partial = path.with_name(f"{path.name}.part")
+    headers = {"If-None-Match": etag} if etag is not None else {}
+
+    with http_session().get(
+        url, headers=headers, stream=True, timeout=HTTP_TIMEOUT
+    ) as response:
+        if response.status_code == 304 and etag is not None:
+            return False, etag
+
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to download {url}: {response.text}")
+
+        # Content-Length is the size before decoding, if the body is encoded.
+        if "Content-Encoding" in response.headers:
+            expected = -1
+        else:
+            expected = int(response.headers.get("Content-Length", -1))
+
+        received = 0
+
+        # A buffered file, unlike a raw one, never writes only part of a
+        # chunk, so every byte received is counted.
+        with open(partial, "wb") as file:
+            if expected > 0 and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(file.fileno(), 0, expected)
+                except OSError:
+                    # Not supported by every file system. The space is then
+                    # allocated as the file is written instead.
+                    pass
+
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                file.write(chunk)
+                received += len(chunk)
+
+    if expected >= 0 and received != expected:
+        partial.unlink(missing_ok=True)
+        raise RuntimeError(
+            f"Failed to download {url}: expected {expected} bytes, "
+            f"received {received}."
+        )
+
+    os.replace(partial, path)
+    return True, response.headers.get("ETag")
+
+
+class PaperCache:
+    """An on-disk cache of responses from PaperMC's API.
+
+    Cached responses younger than the ``max-age`` PaperMC sent with them, or
+    `PAPER_CACHE_TTL` if it sent none, are used without making a request.
+    Older responses are revalidated with a conditional request, and are
+    still used if the request fails.
+
+    Parameters
+    ----------
+    root : str | os.PathLike[str]
+        The Fuji directory. The responses are stored in its `.cache`
+        directory.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], /) -> None:
+        self.path = pathlib.Path(root).joinpath(".cache", "paper.json")
+
+    def _read(self) -> dict[str, Any]:
+        """Read the cached responses."""
+        try:
+            entries: dict[str, Any] = read_json(self.path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        return entries
+
+    def peek(self, url: str, /) -> dict[str, Any] | None:
+        """Get the cached response for a URL, however old it is.
+
+        Parameters
+        ----------
+        url : str
+            The API endpoint.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The decoded JSON response, or None if it is not cached.
+        """
+        entry = self._read().get(url)
+
+        if entry is None:
+            return None
+
+        data: dict[str, Any] = entry["data"]
+        return data
+
+    def get(self, url: str, /) -> dict[str, Any]:
+        """Get the JSON response for a URL, from the cache if possible.
+
+        Parameters
+        ----------
+        url : str
+            The API endpoint to query.
+
+        Returns
+        -------
+        dict[str, Any]
+            The decoded JSON response.
+
+        Raises
+        ------
+        RuntimeError
+            If the request failed and there is no cached response.
+        """
+        import requests
+
+        entry = self._read().get(url)
+        headers = {}
+
+        if entry is not None:
+            ttl = entry.get("max_age")
+            ttl = PAPER_CACHE_TTL if ttl is None else ttl
+
+            if time.time() - entry["fetched_at"] < ttl:
+                data: dict[str, Any] = entry["data"]
+                return data
+
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = http_session().get(
+                url, headers=headers, timeout=HTTP_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            if entry is None:
+                raise RuntimeError(f"Failed to query PaperMC: {exc}") from exc
+
+            _log.warning(f"Using cached response for {url!r}: {exc}")
+            data = entry["data"]
+            return data
+
+        if response.status_code == 304 and entry is not None:
+            _log.debug(f"Cached response for {url!r} is still valid.")
+            data = entry["data"]
+        else:
+            data = loads(response.content)
+            entry = {}
+
+        entry = {
+            "fetched_at": time.time(),
+            "max_age": max_age(response.headers),
+            "etag": response.headers.get("ETag", entry.get("etag")),
+            "last_modified": response.headers.get(
+                "Last-Modified", entry.get("last_modified")
+            ),
+            "data": data,
+        }
+
+        with _paper_cache_lock:
+            entries = self._read()
+            entries[url] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_json(self.path, entries)
+
+        return data
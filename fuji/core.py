@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import os
 import pathlib
 from typing import TYPE_CHECKING
 
+from ._core import (
+    CONFIG_FILE,
+    DEFAULT_ROOT,
+    DEFAULT_ROOT_STR,
+    load_config,
+    make_subdirectories,
+    save_config,
+)
 from .servers import MinecraftServer
 
 if TYPE_CHECKING:
@@ -16,37 +25,35 @@ _log = logging.getLogger(__name__)
 
 
 class Fuji:
-    DEFAULT_ROOT = pathlib.Path.home().joinpath(".fuji")
-    CONFIG_JSON = pathlib.Path(__file__).parents[1].joinpath("config.json")
+    DEFAULT_ROOT = DEFAULT_ROOT
+    DEFAULT_ROOT_STR = DEFAULT_ROOT_STR
+    CONFIG_JSON = CONFIG_FILE
 
-    def __init__(self, directory: str = str(DEFAULT_ROOT)) -> None:
-        self.config = self.load_config()
-        self._root = self._config.get("root", directory)
+    def __init__(self, directory: str = DEFAULT_ROOT_STR) -> None:
+        self._directory = directory
 
-    def load_config(self) -> Dict[str, Any]:
-        """Read from the configuration file."""
-        default_data = {
-            "root": str(self.DEFAULT_ROOT),
-        }
+    @functools.cached_property
+    def config(self) -> Dict[str, Any]:
+        """The contents of the configuration file, read on first access."""
+        return self.load_config()
 
-        try:
-            data = json.loads(self.CONFIG_JSON.read_text())
-        except (FileNotFoundError, json.JSONDecodeError) as exc:
-            _log.warning(
-                f"Using default configuration. Unable to load existing: {exc}"
-            )
-            data = default_data
+    @functools.cached_property
+    def root(self) -> pathlib.Path:
+        """The base directory of all Fuji-related files."""
+        return pathlib.Path(self.config.get("root", self._directory))
 
-        return data
+    def load_config(self) -> Dict[str, Any]:
+        """Read from the configuration file."""
+        return load_config()
 
     def save_config(self, data: Optional[Dict[str, Any]] = None, /) -> None:
         """Write to the configuration file."""
         if not data:
-            data = self._config
+            data = self.config
 
-        self.CONFIG_JSON.write_text(json.dumps(data, indent=4))
+        save_config(data)
 
-    def init(self, directory: str = str(DEFAULT_ROOT)) -> None:
+    def init(self, directory: str = DEFAULT_ROOT_STR) -> None:
         """Run once to initialize Fuji.
 
         Parameters
@@ -59,15 +66,18 @@ class Fuji:
         if root.exists():
             raise FileExistsError(f"Directory '{root}' already exists.")
 
-        root.mkdir(parents=True, exist_ok=True)
-        subdirectories = ("backups", "logs", "jars", "servers")
-
-        for subdirectory in subdirectories:
-            root.joinpath(subdirectory).mkdir()
+        make_subdirectories(root, ("backups", "logs", "jars", "servers"))
 
         _log.info(f"Initialized Fuji in {root}.")
 
-    @property
+    @functools.cached_property
     def servers(self) -> List[MinecraftServer]:
-        """A list of all servers."""
-        ...
+        """A list of all servers, read on first access."""
+        directory = self.root.expanduser().joinpath("servers")
+
+        with os.scandir(directory) as it:
+            return [
+                MinecraftServer(entry.path)
+                for entry in it
+                if entry.is_dir(follow_symlinks=False)
+            ]
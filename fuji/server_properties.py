@@ -1,6 +1,18 @@
 import json
+import re
 import sys
-from typing import Any, Literal, Mapping, TypedDict, Union, cast
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    TypedDict,
+    Union,
+    cast,
+)
+
+from ._core import loads
 
 if sys.version_info >= (3, 9):
     from builtins import list as List
@@ -22,6 +34,10 @@ LevelType = Literal[
 JSON_Any = Union[str, int, float, bool, None, Mapping[str, Any], List[Any]]
 JSON_Object = Mapping[str, JSON_Any]
 
+# Matches a `key=value` line, skipping comments.
+_LINE_RE = re.compile(r"^(?!#)([^=\r\n]+)=([^\r\n]*)", re.MULTILINE)
+_BOOLEANS = {"true": True, "false": False}
+
 ServerProperties = TypedDict(
     "ServerProperties",
     {
@@ -86,14 +102,31 @@ ServerProperties = TypedDict(
     },
 )
 
+# Holding a reference keeps the interned keys alive, so every parse shares
+# the same key objects instead of allocating new ones.
+_KNOWN_KEYS = frozenset(
+    sys.intern(k) for k in ServerProperties.__annotations__
+)
+
 
-def deserialize_server_properties(properties: str, /) -> ServerProperties:
+def _iter_items(lines: Iterable[str], /) -> Iterator[tuple[str, str]]:
+    """Yield the key-value pairs from the lines of a server.properties file."""
+    for line in lines:
+        match = _LINE_RE.match(line)
+        if match is not None:
+            yield match[1], match[2]
+
+
+def deserialize_server_properties(
+    properties: str | Iterable[str], /
+) -> ServerProperties:
     """Convert the items in a server.properties file into a dictionary.
 
     Parameters
     ----------
-    server_properties : :class:`str`
-        The contents of a server.properties file.
+    properties : :class:`str` | Iterable[:class:`str`]
+        The contents of a server.properties file, or an iterable of its
+        lines, such as an open file, which is then read line by line.
 
     Returns
     -------
@@ -101,26 +134,28 @@ def deserialize_server_properties(properties: str, /) -> ServerProperties:
         A mapping of server.properties keys to their converted values.
     """
     result = {}
+    items: Iterable[tuple[str, str]]
 
-    for line in properties.splitlines():
-        if line.startswith("#"):
-            continue  # Skip comments
+    if isinstance(properties, str):
+        items = _LINE_RE.findall(properties)
+    else:
+        items = _iter_items(properties)
 
-        key, value = line.split("=", 1)
+    for key, value in items:
         new_value: JSON_Any
 
-        if value in ("true", "false"):
-            new_value = value == "true"
+        if not value:
+            new_value = None
+        elif value in _BOOLEANS:
+            new_value = _BOOLEANS[value]
         elif value.isnumeric():
             new_value = int(value)
-        elif value == "":
-            new_value = None
-        elif value.startswith("{"):
-            new_value = json.loads(value)
+        elif value[0] == "{":
+            new_value = loads(value)
         else:
             new_value = value  # Leave as string
 
-        result[key] = new_value
+        result[sys.intern(key)] = new_value
 
     return cast(ServerProperties, result)
 
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import fcntl
+import filecmp
+import functools
+import json
 import logging
 import os
 import pathlib
+import selectors
+import shlex
+import shutil
 import socket
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-import requests
-
+from ._core import (
+    PaperCache,
+    download,
+    read_json,
+    update_symlink,
+    write_json,
+)
 from .server_properties import (
     ServerProperties,
     deserialize_server_properties,
@@ -16,11 +31,98 @@ from .server_properties import (
 )
 
 if TYPE_CHECKING:
+    from builtins import dict as Dict
     from builtins import tuple as Tuple
-    from typing import Optional
+    from typing import Any, Iterable, Optional
+
+EXISTS_CACHE_TTL = 1.0  # seconds
+PLUGIN_MAX_WORKERS = 8
+SLP_TIMEOUT = 0.5  # seconds
 
 _log = logging.getLogger(__name__)
 
+# Guards the read-modify-write of the plugin ETag cache.
+_plugin_cache_lock = threading.Lock()
+
+
+def _pack_varint(value: int) -> bytes:
+    """Encode an integer as a VarInt, as used by Minecraft's protocol."""
+    value &= 0xFFFFFFFF
+    result = bytearray()
+
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+
+        if not value:
+            result.append(byte)
+            return bytes(result)
+
+        result.append(byte | 0x80)
+
+
+def _unpack_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Decode a VarInt, returning its value and the offset after it."""
+    value = 0
+
+    for shift in range(0, 35, 7):
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+
+        if not byte & 0x80:
+            # VarInts are signed 32-bit integers.
+            value &= 0xFFFFFFFF
+            if value & 0x80000000:
+                value -= 1 << 32
+
+            return value, offset
+
+    raise ValueError("VarInt is too big.")
+
+
+def _status_request(host: str, port: int) -> bytes:
+    """Build the handshake and status request of a Server List Ping."""
+    encoded_host = host.encode()
+    handshake = b"".join(
+        (
+            b"\x00",  # Packet ID
+            _pack_varint(-1),  # Protocol version, unknown
+            _pack_varint(len(encoded_host)),
+            encoded_host,
+            port.to_bytes(2, "big"),
+            b"\x01",  # Next state: status
+        )
+    )
+    return _pack_varint(len(handshake)) + handshake + b"\x01\x00"
+
+
+def _is_status_response(data: bytes) -> bool:
+    """Whether the data starts with a Server List Ping status response."""
+    try:
+        _, offset = _unpack_varint(data, 0)
+        packet_id, _ = _unpack_varint(data, offset)
+    except (IndexError, ValueError):
+        return False
+
+    return packet_id == 0x00
+
+
+def _is_eula_accepted(eula: pathlib.Path) -> bool:
+    """Whether an eula.txt file accepts the Minecraft EULA."""
+    try:
+        content = eula.read_bytes()
+    except FileNotFoundError:
+        return False
+
+    for line in content.splitlines():
+        key, _, value = line.partition(b"=")
+
+        if key.strip() == b"eula":
+            return value.strip().lower() == b"true"
+
+    return False
+
 
 class MinecraftServer:
     """Represents a Minecraft server in Fuji's 'servers' directory.
@@ -33,12 +135,30 @@ class MinecraftServer:
 
     def __init__(self, path: str) -> None:
         self._path = path
+        self._exists: Optional[Tuple[float, bool]] = None
+        self._properties: Optional[Tuple[int, ServerProperties]] = None
+        self._lock_fd: Optional[int] = None
 
-    @property
+    @functools.cached_property
     def path(self) -> pathlib.Path:
         """The path to the server's directory."""
         return pathlib.Path(self._path).expanduser()
 
+    @functools.cached_property
+    def _fuji_dir(self) -> pathlib.Path:
+        """The Fuji directory the server belongs to."""
+        return self.path.parents[1]
+
+    @functools.cached_property
+    def _jars_dir(self) -> pathlib.Path:
+        """The directory PaperMC JAR files are downloaded to."""
+        return self._fuji_dir.joinpath("jars")
+
+    @functools.cached_property
+    def _plugin_cache(self) -> pathlib.Path:
+        """The file the ETags of downloaded plugins are stored in."""
+        return self._fuji_dir.joinpath(".cache", "plugins.json")
+
     @property
     def name(self) -> str:
         """The name of the server."""
@@ -46,72 +166,234 @@ class MinecraftServer:
 
     @property
     def exists(self) -> bool:
-        """Whether or not the server exists."""
-        return self.path.exists()
+        """Whether or not the server exists.
+
+        The result is remembered for :data:`EXISTS_CACHE_TTL` seconds, or
+        until :meth:`invalidate` is called.
+        """
+        now = time.monotonic()
+
+        if self._exists is None or now - self._exists[0] >= EXISTS_CACHE_TTL:
+            self._exists = (now, self.path.exists())
+
+        return self._exists[1]
+
+    def invalidate(self) -> None:
+        """Forget the cached result of :attr:`exists`."""
+        self._exists = None
 
     @property
     def properties(self) -> ServerProperties:
-        """The contents of the server.properties file."""
-        with open(self.path / "server.properties") as file:
-            return deserialize_server_properties(file.read())
+        """The contents of the server.properties file.
+
+        The file is only parsed again if it was modified since it was last
+        read.
+        """
+        path = self.path / "server.properties"
+        mtime = os.stat(path).st_mtime_ns
+
+        if self._properties is None or self._properties[0] != mtime:
+            with open(path) as file:
+                properties = deserialize_server_properties(file)
+
+            self._properties = (mtime, properties)
+
+        return self._properties[1]
 
     @properties.setter
     def properties(self, properties: ServerProperties) -> None:
         with open(self.path / "server.properties", "w") as file:
             file.write(serialize_server_properties(properties))
 
-    @property
+        self._properties = None
+
+    @functools.cached_property
     def server_jar(self) -> pathlib.Path:
         """The path to the server's JAR file."""
         return self.path.joinpath("server.jar")
 
-    @property
+    @functools.cached_property
     def lock_file(self) -> pathlib.Path:
         """The path to the server's lock file."""
         return self.path.joinpath(".lock")
 
     def is_locked(self) -> bool:
-        """Whether or not the server is locked."""
-        return self.lock_file.exists()
+        """Whether or not the server is locked by any process."""
+        if self._lock_fd is not None:
+            return True
+
+        try:
+            fd = os.open(self.lock_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
+
+        return False
 
     def lock(self) -> None:
-        """Lock the server."""
-        self.lock_file.touch(exist_ok=True)
+        """Lock the server.
+
+        The lock is an exclusive :func:`fcntl.flock` on the lock file, so it
+        is released by the operating system if the process holding it exits
+        without calling :meth:`unlock`. The lock file itself is left in
+        place, and contains the PID of the process that last held the lock.
+
+        Raises
+        ------
+        RuntimeError
+            If the server is already locked.
+        """
+        if self._lock_fd is not None:
+            raise RuntimeError(f"Server {self.name!r} is already locked.")
+
+        fd = os.open(self.lock_file, os.O_CREAT | os.O_RDWR, 0o644)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError(
+                f"Server {self.name!r} is already locked."
+            ) from None
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
 
     def unlock(self) -> None:
-        """Unlock the server."""
-        if self.is_locked:
-            os.remove(self.lock_file)
+        """Unlock the server, if it was locked by this object."""
+        if self._lock_fd is None:
+            return
+
+        # Removing the file could let two processes lock different files at
+        # the same path, so the lock is only released.
+        os.close(self._lock_fd)
+        self._lock_fd = None
 
     @property
     def server_ip(self) -> str:
         """The server's IP address."""
-        return self.properties.get("server-ip", "127.0.0.1")
+        # An empty `server-ip` is parsed as None, so `.get` is not enough.
+        return self.properties.get("server-ip") or "127.0.0.1"
 
     @property
     def server_port(self) -> int:
         """The server's port."""
-        return self.properties.get("server-port", 25565)
+        return self.properties.get("server-port") or 25565
 
     def status(self) -> bool:
         """Whether the server is currently running.
 
-        The server is considered active if a connection can be made to it.
-        (The connection is immediately closed after being opened.)
+        The server is considered active if it answers a Server List Ping
+        within :data:`SLP_TIMEOUT` seconds. Unlike only connecting to the
+        port, this also detects a server that is stuck.
 
         Returns
         -------
         :class:`bool`
             ``True`` if the server is running, ``False`` otherwise.
         """
-        address = (self.server_ip, self.server_port)
-
         try:
-            with socket.create_connection(address, timeout=1.0):
-                return True
+            # Reading server.properties may fail too, e.g. before the server
+            # has been set up.
+            address = (self.server_ip, self.server_port)
+
+            with socket.create_connection(address, timeout=1.0) as sock:
+                sock.settimeout(SLP_TIMEOUT)
+                sock.sendall(_status_request(*address))
+                return _is_status_response(sock.recv(16))
         except OSError:
             return False
 
+    @staticmethod
+    def status_many(
+        servers: Iterable[MinecraftServer], /, *, timeout: float = 1.0
+    ) -> Dict[str, bool]:
+        """Check whether several servers are running, all at once.
+
+        The servers are pinged concurrently using non-blocking sockets, in
+        the same way as :meth:`status`.
+
+        Parameters
+        ----------
+        servers : Iterable[:class:`MinecraftServer`]
+            The servers to check.
+        timeout : :class:`float`, optional
+            The maximum number of seconds to wait for all of the servers.
+
+        Returns
+        -------
+        :class:`dict`
+            A mapping of each server's name to whether it is running.
+        """
+        results: Dict[str, bool] = {}
+
+        with selectors.DefaultSelector() as selector:
+            for server in servers:
+                results[server.name] = False
+
+                try:
+                    host, port = server.server_ip, server.server_port
+                    family, type_, proto, _, sockaddr = socket.getaddrinfo(
+                        host, port, type=socket.SOCK_STREAM
+                    )[0]
+                    sock = socket.socket(family, type_, proto)
+                except OSError:
+                    continue
+
+                sock.setblocking(False)
+                sock.connect_ex(sockaddr)
+                # The socket is kept with its data, since the selector only
+                # knows it as a file object.
+                data = (sock, server.name, _status_request(host, port))
+                selector.register(sock, selectors.EVENT_WRITE, data)
+
+            deadline = time.monotonic() + timeout
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                for key, events in selector.select(remaining):
+                    sock, name, request = key.data
+
+                    if events & selectors.EVENT_WRITE:
+                        error = sock.getsockopt(
+                            socket.SOL_SOCKET, socket.SO_ERROR
+                        )
+
+                        if error == 0:
+                            try:
+                                sock.send(request)
+                            except OSError:
+                                pass
+                            else:
+                                selector.modify(
+                                    sock, selectors.EVENT_READ, key.data
+                                )
+                                continue
+                    else:
+                        try:
+                            results[name] = _is_status_response(sock.recv(16))
+                        except OSError:
+                            pass
+
+                    selector.unregister(sock)
+                    sock.close()
+
+            for key in list(selector.get_map().values()):
+                selector.unregister(key.fileobj)
+                key.data[0].close()
+
+        return results
+
     def create(
         self,
         *,
@@ -121,6 +403,10 @@ class MinecraftServer:
     ) -> None:
         """Make the server directory and generate the server.properties file.
 
+        If an earlier call did not finish, e.g. because the EULA was not
+        accepted, the setup is resumed instead, skipping the steps that are
+        already done.
+
         Parameters
         ----------
         accept_eula : :class:`bool`
@@ -133,12 +419,23 @@ class MinecraftServer:
         build : :class:`int`, optional
             A specific build of the server to install. Must be a valid build
             for the specified version.
+
+        Raises
+        ------
+        FileExistsError
+            If the server has already been set up.
         """
-        if self.exists:
-            raise FileExistsError(f"Server {self.name!r} already exists.")
+        server_properties = self.path.joinpath("server.properties")
+        eula = self.path.joinpath("eula.txt")
 
-        self.path.mkdir(parents=True)
-        _log.info(f"Created directory at {self.path}")
+        if not self.exists:
+            self.path.mkdir(parents=True)
+            self.invalidate()
+            _log.info(f"Created directory at {self.path}")
+        elif server_properties.exists() and _is_eula_accepted(eula):
+            raise FileExistsError(f"Server {self.name!r} already exists.")
+        else:
+            _log.info(f"Resuming the setup of server {self.name!r}.")
 
         self.update(version=version, build=build)
         self._generate_server_properties(accept_eula=accept_eula)
@@ -162,31 +459,72 @@ class MinecraftServer:
         if not self.exists:
             raise FileNotFoundError(f"Server {self.name!r} does not exist.")
 
-        name, content = self._download_server_jar(version, build)
+        jars = self._jars_dir
+        _, paper_jar = self._download_server_jar(jars, version, build)
+        self._link_server_jar(paper_jar)
 
-        if name == self.server_jar.resolve().name:
-            return
+    @staticmethod
+    def update_many(
+        servers: Iterable[MinecraftServer],
+        /,
+        *,
+        version: Optional[str] = None,
+        build: Optional[int] = None,
+    ) -> None:
+        """Update several servers to the same version and build.
 
-        fuji_dir = self.path.parents[1]
-        paper_jar = fuji_dir.joinpath("jars", name)
-        _log.info(f"Writing bytes to {paper_jar}...")
-        paper_jar.write_bytes(content)
+        PaperMC is queried and the JAR file downloaded once per Fuji
+        directory, rather than once per server.
 
-        _log.info(f"Creating symlink {self.server_jar} -> {paper_jar}")
+        Parameters
+        ----------
+        servers : Iterable[:class:`MinecraftServer`]
+            The servers to update.
+        version : :class:`str`, optional
+            The version of the server to install.
+        build : :class:`int`, optional
+            The build of the server to install.
+        """
+        downloads: Dict[pathlib.Path, pathlib.Path] = {}
+
+        for server in servers:
+            if not server.exists:
+                raise FileNotFoundError(
+                    f"Server {server.name!r} does not exist."
+                )
 
-        if self.server_jar.exists():
-            self.server_jar.unlink()
+            jars = server._jars_dir
 
-        self.server_jar.symlink_to(paper_jar)
+            if jars not in downloads:
+                _, downloads[jars] = server._download_server_jar(
+                    jars, version, build
+                )
+
+            server._link_server_jar(downloads[jars])
+
+    def _link_server_jar(self, paper_jar: pathlib.Path) -> None:
+        """Point the server's JAR file at a downloaded JAR, if it is not."""
+        if not update_symlink(self.server_jar, paper_jar):
+            return
+
+        _log.info(f"Created symlink {self.server_jar} -> {paper_jar}")
         _log.info(f"Successfully updated server {self.name!r}.")
 
     def _download_server_jar(
-        self, version: Optional[str] = None, build: Optional[int] = None
-    ) -> Tuple[str, bytes]:
+        self,
+        jars: pathlib.Path,
+        version: Optional[str] = None,
+        build: Optional[int] = None,
+    ) -> Tuple[str, pathlib.Path]:
         """Download the server JAR file from PaperMC's API.
 
+        The JAR file is streamed directly to disk, and is not downloaded
+        again if it already exists.
+
         Parameters
         ----------
+        jars : :class:`pathlib.Path`
+            The directory to store the JAR file in.
         version : :class:`str`, optional
             The version of the server to install.
         build : :class:`int`, optional
@@ -195,29 +533,21 @@ class MinecraftServer:
         Returns
         -------
         :class:`tuple`
-            A tuple containing the name of the JAR file and its contents.
+            A tuple containing the name of the JAR file and its path.
         """
+        cache = PaperCache(self._fuji_dir)
         url = "https://papermc.io/api/v2/projects/paper"
 
         if version is None:
-            if (response := requests.get(url)).status_code != 200:
-                raise RuntimeError(
-                    f"Failed to get latest version of PaperMC: {response.text}"
-                )
-
-            version = response.json()["versions"][-1]
+            version = cache.get(url)["versions"][-1]
 
         url += f"/versions/{version}/builds"
-
-        if (response := requests.get(url)).status_code != 200:
-            raise RuntimeError(
-                f"Failed to get latest build of PaperMC: {response.text}"
-            )
+        builds = cache.get(url)["builds"]
 
         if build is not None:
-            tmp = response.json()
-
-            for b in tmp["builds"]:
+            # Builds are listed oldest first, and newer builds are the ones
+            # usually asked for.
+            for b in reversed(builds):
                 if b["build"] == build:
                     data = b
                     break
@@ -226,25 +556,22 @@ class MinecraftServer:
                     f"Version {version} does not have build {build}"
                 )
         else:
-            data = response.json()["builds"][-1]
+            data = builds[-1]
 
         build = build or data["build"]
         name = data["downloads"]["application"]["name"]
-        jars = self.path.parents[1].joinpath("jars")
+        paper_jar = jars.joinpath(name)
 
-        for file in jars.iterdir():
-            if name == file.name:
-                _log.info("PaperMC is already up-to-date. Skipping download.")
-                return name, file.read_bytes()
+        if paper_jar.is_file():
+            _log.info("PaperMC is already up-to-date. Skipping download.")
+            return name, paper_jar
 
         url += f"/{build}/downloads/{name}"
         _log.info(f"Downloading PaperMC {version} build {build}...")
 
-        if (response := requests.get(url)).status_code != 200:
-            raise RuntimeError(f"Failed to download PaperMC: {response.text}")
-
+        download(url, paper_jar)
         _log.info("Download complete.")
-        return name, response.content
+        return name, paper_jar
 
     def _generate_server_properties(
         self, /, *, accept_eula: bool = False
@@ -260,28 +587,33 @@ class MinecraftServer:
             Whether to accept the EULA without prompting the user.
         """
         server_properties = self.path.joinpath("server.properties")
+        eula = self.path.joinpath("eula.txt")
+        # The server never changes an accepted EULA, so this can be checked
+        # before it runs.
+        eula_accepted = _is_eula_accepted(eula)
 
         if server_properties.exists():
-            _log.warning(
+            _log.info(
                 f"Server {self.name!r} already has a server.properties file."
             )
         else:
-            cmd = ["java", "-jar", self.server_jar, "--nogui"]
-            _log.info(f"Running command: {' '.join(cmd)!r}")
+            cmd = ["java", "-jar", str(self.server_jar), "--nogui"]
+            _log.info(f"Running command: {shlex.join(cmd)!r}")
+            # CPython already spawns with vfork() where it can. Detaching the
+            # child from our terminal keeps it from reading our stdin or
+            # receiving our signals.
             subprocess.run(
                 cmd,
                 shell=False,
                 cwd=self.path,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
 
-        eula = self.path.joinpath("eula.txt")
-
-        if "eula=true" in eula.read_text().lower():
-            _log.warning(
-                f"Server {self.name!r} has already accepted the EULA."
-            )
+        if eula_accepted:
+            _log.info(f"Server {self.name!r} has already accepted the EULA.")
             return
 
         if not accept_eula:
@@ -315,7 +647,8 @@ class MinecraftServer:
             if response.lower() not in ("y", "yes"):
                 return
 
-        self.path.rmdir()
+        shutil.rmtree(self.path)
+        self.invalidate()
         _log.info(f"Successfully deleted server {self.name!r}.")
 
     def start(self) -> None:
@@ -350,14 +683,14 @@ class MinecraftServer:
         url : :class:`str`, optional
             The URL to the plugin's JAR file.
         """
-        if not self.path.exists():
+        if not self.exists:
             raise FileNotFoundError(f"Server {self.name!r} does not exist.")
 
         if local_path is None and url is None:
             raise RuntimeError("Either local_path or url must be specified.")
 
         plugin = self.path.joinpath("plugins", file_name)
-        plugin_data = None
+        copied = False
 
         if local_path is not None:
             file = pathlib.Path(local_path).expanduser()
@@ -372,30 +705,106 @@ class MinecraftServer:
                 raise RuntimeError(f"{file} is not a JAR file.")
 
             try:
-                plugin_data = file.read_bytes()
-            except Exception as exc:
-                _log.error(f"Failed to read {file}: {exc}")
+                # Compares sizes first, then contents in chunks.
+                identical = filecmp.cmp(file, plugin, shallow=False)
+            except FileNotFoundError:
+                identical = False
+
+            if identical:
+                _log.info(f"Plugin {file_name!r} is already up-to-date.")
+                return
+
+            _log.info(f"Copying {file} to {plugin}...")
 
-        if url is not None and plugin_data is None:
-            response = requests.get(url)
+            try:
+                # Uses sendfile()/fcopyfile() where available, so the data
+                # never passes through Python.
+                shutil.copyfile(file, plugin)
+            except OSError as exc:
+                _log.error(f"Failed to copy {file}: {exc}")
+            else:
+                copied = True
 
-            if response.status_code != 200:
+        if not copied:
+            if url is None:
                 raise RuntimeError(
-                    f"Failed to download plugin: {response.text}"
+                    f"Failed to get plugin data for {file_name!r}."
                 )
 
-            try:
-                plugin_data = response.content
-            except Exception as exc:
-                _log.error(f"Failed to download plugin: {exc}")
+            _log.info(f"Downloading {url} to {plugin}...")
+            etag = self._get_plugin_etag(plugin, url)
+            downloaded, etag = download(url, plugin, etag=etag)
+
+            if not downloaded:
+                _log.info(f"Plugin {file_name!r} is already up-to-date.")
+                return
 
-        if plugin_data is None:
-            raise RuntimeError(f"Failed to get plugin data for {file_name!r}.")
+            self._set_plugin_etag(plugin, url, etag)
 
-        _log.info(f"Writing bytes to {plugin}...")
-        plugin.write_bytes(plugin_data)
         _log.info(f"Successfully installed plugin {file_name!r}.")
 
+    def _get_plugin_etag(
+        self, plugin: pathlib.Path, url: str
+    ) -> Optional[str]:
+        """Get the ETag of a plugin, if it was downloaded from ``url``.
+
+        The ETag is only returned if the plugin has not been modified since
+        it was downloaded.
+        """
+        try:
+            entry = read_json(self._plugin_cache)[str(plugin)]
+            st = plugin.stat()
+        except (FileNotFoundError, KeyError, json.JSONDecodeError):
+            return None
+
+        if entry["url"] != url or entry["stat"] != [
+            st.st_size,
+            st.st_mtime_ns,
+        ]:
+            return None
+
+        etag: Optional[str] = entry["etag"]
+        return etag
+
+    def _set_plugin_etag(
+        self, plugin: pathlib.Path, url: str, etag: Optional[str]
+    ) -> None:
+        """Remember the ETag of a plugin downloaded from ``url``."""
+        st = plugin.stat()
+
+        # add_plugins() may download several plugins at once.
+        with _plugin_cache_lock:
+            try:
+                entries = read_json(self._plugin_cache)
+            except (FileNotFoundError, json.JSONDecodeError):
+                entries = {}
+
+            entries[str(plugin)] = {
+                "url": url,
+                "etag": etag,
+                "stat": [st.st_size, st.st_mtime_ns],
+            }
+            self._plugin_cache.parent.mkdir(exist_ok=True)
+            write_json(self._plugin_cache, entries)
+
+    def add_plugins(self, plugins: Iterable[Dict[str, Any]], /) -> None:
+        """Install or update several plugins at once.
+
+        The plugins are installed concurrently.
+
+        Parameters
+        ----------
+        plugins : Iterable[:class:`dict`]
+            The keyword arguments to pass to :meth:`add_plugin` for each
+            plugin.
+        """
+        with ThreadPoolExecutor(PLUGIN_MAX_WORKERS) as executor:
+            futures = [executor.submit(self.add_plugin, **p) for p in plugins]
+
+            # Raise the first error, if any, once all plugins are done.
+            for future in futures:
+                future.result()
+
     def remove_plugin(self, file_name: str) -> None:
         """Remove a plugin from the server's "plugins" directory.
 
@@ -404,7 +813,7 @@ class MinecraftServer:
         file_name : :class:`str`
             The name of the plugin's JAR file.
         """
-        if not self.path.exists():
+        if not self.exists:
             raise FileNotFoundError(f"Server {self.name!r} does not exist.")
 
         plugin = self.path.joinpath("plugins", file_name)
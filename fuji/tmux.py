@@ -1,60 +1,188 @@
+from __future__ import annotations
+
+import atexit
 import logging
+import os
 import subprocess
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from builtins import list as List
+    from builtins import tuple as Tuple
+    from typing import Optional
 
 _log = logging.getLogger(__name__)
 
 
+def _quote(argument: str) -> str:
+    """Quote an argument for tmux's command parser.
+
+    Raises
+    ------
+    :class:`ValueError`
+        The argument contains a newline, which would end the command early.
+    """
+    if "\n" in argument:
+        raise ValueError(f"Argument contains a newline: {argument!r}")
+
+    if "'" not in argument:
+        return f"'{argument}'"
+
+    for char in ("\\", '"', "$"):
+        argument = argument.replace(char, f"\\{char}")
+
+    return f'"{argument}"'
+
+
+class _TmuxControl:
+    """A tmux client in control mode, shared by all sessions.
+
+    Commands are written to a single long-running ``tmux -C`` process instead
+    of starting a new ``tmux`` process for each one. The client is attached to
+    a session of its own, ``fuji-control-<pid>``, which is listed by
+    ``tmux ls`` like any other session while the client is running. The
+    session is destroyed as soon as the client detaches, including when the
+    interpreter is killed without running its exit handlers.
+    """
+
+    _instance: Optional[_TmuxControl] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.session = f"fuji-control-{os.getpid()}"
+        self._lock = threading.Lock()
+        args = ["tmux", "-C", "new-session", "-s", self.session]
+        args += [";", "set-option", "-t", self.session]
+        args += ["destroy-unattached", "on"]
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        # The first replies are for the commands the client was started with.
+        # If either fails, tmux exits rather than waiting for more commands.
+        for _ in range(2):
+            ok, output = self._read_reply()
+
+            if not ok:
+                self._process.wait()
+                raise RuntimeError(
+                    f"Failed to start the tmux control client: {output}"
+                )
+
+        atexit.register(self.close)
+
+    @classmethod
+    def get(cls) -> _TmuxControl:
+        """Get the shared client, starting it if it is not running."""
+        with cls._instance_lock:
+            if (
+                cls._instance is None
+                or cls._instance._process.poll() is not None
+            ):
+                cls._instance = cls()
+
+            return cls._instance
+
+    def command(self, *args: str) -> Tuple[bool, List[str]]:
+        """Run a tmux command.
+
+        Parameters
+        ----------
+        *args : :class:`str`
+            The command and its arguments.
+
+        Returns
+        -------
+        :class:`tuple`
+            Whether the command succeeded, and the lines it printed.
+        """
+        line = " ".join(map(_quote, args))
+
+        with self._lock:
+            assert self._process.stdin is not None
+            self._process.stdin.write(f"{line}\n")
+            self._process.stdin.flush()
+            return self._read_reply()
+
+    def _read_reply(self) -> Tuple[bool, List[str]]:
+        """Read the output of a command, skipping any notifications."""
+        assert self._process.stdout is not None
+        output: List[str] = []
+        in_reply = False
+
+        for line in self._process.stdout:
+            line = line.rstrip("\n")
+
+            if not in_reply:
+                # Anything outside of a %begin/%end block is a notification.
+                in_reply = line.startswith("%begin ")
+            elif line.startswith("%end "):
+                return True, output
+            elif line.startswith("%error "):
+                return False, output
+            else:
+                output.append(line)
+
+        raise RuntimeError("The tmux control client exited unexpectedly.")
+
+    def close(self) -> None:
+        """Stop the client, which also destroys its session."""
+        if self._process.poll() is not None:
+            return
+
+        assert self._process.stdin is not None
+        self._process.stdin.close()
+        self._process.wait()
+
+
 class TmuxSession:
     def __init__(self, name: str) -> None:
         self.name = name
 
     def is_alive(self) -> bool:
-        try:
-            _ = subprocess.check_output(
-                ["tmux", "has-session", "-t", self.name],
-                shell=False,
-                stderr=subprocess.DEVNULL,
-            )
-        except subprocess.CalledProcessError:
-            return False
-
-        return True
+        ok, _ = _TmuxControl.get().command("has-session", "-t", self.name)
+        return ok
 
     def create(self) -> None:
-        if self.is_alive():
+        # tmux refuses to create a duplicate session, so there is no need to
+        # check whether the session exists with a separate command first.
+        ok, _ = _TmuxControl.get().command(
+            "new-session", "-d", "-s", self.name
+        )
+
+        if not ok:
             _log.warning(f"Session {self.name!r} already exists.")
             return
 
-        _ = subprocess.run(
-            ["tmux", "new-session", "-d", "-s", self.name],
-            shell=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
         _log.info(f"Created session: {self.name!r}")
 
     def destroy(self) -> None:
-        if not self.is_alive():
+        ok, _ = _TmuxControl.get().command("kill-session", "-t", self.name)
+
+        if not ok:
             _log.warning(f"Session {self.name!r} does not exist.")
             return
 
-        _ = subprocess.run(
-            ["tmux", "kill-session", "-t", self.name],
-            shell=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
         _log.info(f"Killed session: {self.name!r}")
 
     def send_keys(self, command: str) -> None:
-        if not self.is_alive():
+        # Newlines cannot be sent as part of a control mode command, so each
+        # one is sent as the key it stands for instead.
+        keys: List[str] = []
+        for line in command.split("\n"):
+            if keys:
+                keys.append("Enter")
+            if line:
+                keys.append(line)
+
+        ok, _ = _TmuxControl.get().command("send-keys", "-t", self.name, *keys)
+
+        if not ok:
             _log.warning(f"Session {self.name!r} does not exist.")
             return
 
-        _ = subprocess.run(
-            ["tmux", "send-keys", "-t", self.name, command],
-            shell=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
         _log.info(f"Sent keys to session {self.name!r}: {command!r}")
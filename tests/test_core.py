@@ -0,0 +1,171 @@
+import pathlib
+import tempfile
+import time
+import unittest
+from typing import Dict, Optional
+from unittest import mock
+
+import requests
+
+from fuji._core import PaperCache, download, max_age, write_json
+
+
+class MaxAgeTest(unittest.TestCase):
+    def test_max_age(self) -> None:
+        headers = {"Cache-Control": "public, max-age=600"}
+        self.assertEqual(max_age(headers), 600)
+
+    def test_max_age_zero(self) -> None:
+        self.assertEqual(max_age({"Cache-Control": "max-age=0"}), 0)
+
+    def test_no_cache(self) -> None:
+        headers = {"Cache-Control": "no-cache, max-age=600"}
+        self.assertEqual(max_age(headers), 0)
+
+    def test_no_store(self) -> None:
+        self.assertEqual(max_age({"Cache-Control": "no-store"}), 0)
+
+    def test_s_maxage_is_ignored(self) -> None:
+        self.assertIsNone(max_age({"Cache-Control": "s-maxage=600"}))
+
+    def test_absent(self) -> None:
+        self.assertIsNone(max_age({}))
+        self.assertIsNone(max_age({"Cache-Control": "public"}))
+
+
+def _response(
+    status_code: int = 200,
+    content: bytes = b"",
+    headers: Optional[Dict[str, str]] = None,
+) -> mock.MagicMock:
+    response = mock.MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode()
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.iter_content.return_value = [content[:2], content[2:]]
+    response.__enter__.return_value = response
+    return response
+
+
+class _SessionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = pathlib.Path(directory.name)
+
+        patch = mock.patch("fuji._core.http_session")
+        self.addCleanup(patch.stop)
+        self.session = patch.start().return_value
+
+
+class PaperCacheTest(_SessionTestCase):
+    url = "https://papermc.io/api/v2/projects/paper"
+
+    def test_fresh_response_is_reused(self) -> None:
+        self.session.get.return_value = _response(
+            content=b'{"versions":["1.20.4"]}',
+            headers={"Cache-Control": "max-age=60", "ETag": '"a"'},
+        )
+        cache = PaperCache(self.root)
+
+        self.assertIsNone(cache.peek(self.url))
+        self.assertEqual(cache.get(self.url), {"versions": ["1.20.4"]})
+        self.assertEqual(cache.get(self.url), {"versions": ["1.20.4"]})
+        self.assertEqual(cache.peek(self.url), {"versions": ["1.20.4"]})
+        self.session.get.assert_called_once()
+
+    def test_no_cache_is_revalidated(self) -> None:
+        self.session.get.return_value = _response(
+            content=b"{}", headers={"Cache-Control": "no-cache"}
+        )
+        cache = PaperCache(self.root)
+
+        cache.get(self.url)
+        cache.get(self.url)
+        self.assertEqual(self.session.get.call_count, 2)
+
+    def _write_stale_entry(self) -> None:
+        entry = {
+            "fetched_at": time.time() - 3600,
+            "max_age": None,
+            "etag": '"a"',
+            "last_modified": None,
+            "data": {"versions": ["1.20.4"]},
+        }
+        path = self.root.joinpath(".cache", "paper.json")
+        path.parent.mkdir()
+        write_json(path, {self.url: entry})
+
+    def test_stale_response_is_revalidated(self) -> None:
+        self._write_stale_entry()
+        self.session.get.return_value = _response(304)
+
+        data = PaperCache(self.root).get(self.url)
+
+        self.assertEqual(data, {"versions": ["1.20.4"]})
+        _, kwargs = self.session.get.call_args
+        self.assertEqual(kwargs["headers"], {"If-None-Match": '"a"'})
+
+    def test_stale_response_is_used_on_error(self) -> None:
+        self._write_stale_entry()
+        self.session.get.side_effect = requests.ConnectionError
+
+        with self.assertLogs("fuji._core", "WARNING"):
+            data = PaperCache(self.root).get(self.url)
+
+        self.assertEqual(data, {"versions": ["1.20.4"]})
+
+    def test_error_without_cached_response(self) -> None:
+        self.session.get.side_effect = requests.ConnectionError
+
+        with self.assertRaises(RuntimeError):
+            PaperCache(self.root).get(self.url)
+
+
+class DownloadTest(_SessionTestCase):
+    url = "https://example.com/file.jar"
+
+    def test_download(self) -> None:
+        self.session.get.return_value = _response(
+            content=b"content",
+            headers={"Content-Length": "7", "ETag": '"a"'},
+        )
+        path = self.root.joinpath("file.jar")
+
+        self.assertEqual(download(self.url, path), (True, '"a"'))
+        self.assertEqual(path.read_bytes(), b"content")
+        self.assertEqual(list(self.root.iterdir()), [path])
+
+    def test_truncated_download(self) -> None:
+        self.session.get.return_value = _response(
+            content=b"content", headers={"Content-Length": "100"}
+        )
+        path = self.root.joinpath("file.jar")
+
+        with self.assertRaises(RuntimeError):
+            download(self.url, path)
+
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_encoded_download(self) -> None:
+        # Content-Length is the size of the encoded body.
+        self.session.get.return_value = _response(
+            content=b"content",
+            headers={"Content-Length": "3", "Content-Encoding": "gzip"},
+        )
+        path = self.root.joinpath("file.jar")
+
+        download(self.url, path)
+        self.assertEqual(path.read_bytes(), b"content")
+
+    def test_not_modified(self) -> None:
+        self.session.get.return_value = _response(304)
+        path = self.root.joinpath("file.jar")
+
+        self.assertEqual(download(self.url, path, etag='"a"'), (False, '"a"'))
+        self.assertFalse(path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import pathlib
+import tempfile
+import unittest
+
+from fuji.server_properties import deserialize_server_properties
+
+SERVER_PROPERTIES = """\
+#Minecraft server properties
+#Mon Jan 01 00:00:00 UTC 2024
+enable-jmx-monitoring=false
+level-seed=
+gamemode=survival
+server-port=25565
+motd=A Minecraft Server
+text-filtering-config=
+max-players=20
+spawn-protection=16
+"""
+
+
+class DeserializeServerPropertiesTest(unittest.TestCase):
+    def test_values(self) -> None:
+        properties = deserialize_server_properties(SERVER_PROPERTIES)
+
+        self.assertIs(properties["enable-jmx-monitoring"], False)
+        self.assertIsNone(properties["level-seed"])
+        self.assertEqual(properties["gamemode"], "survival")
+        self.assertEqual(properties["server-port"], 25565)
+        self.assertEqual(properties["motd"], "A Minecraft Server")
+        self.assertNotIn("#Minecraft server properties", properties)
+
+    def test_string_and_file_match(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory).joinpath("server.properties")
+            path.write_text(SERVER_PROPERTIES)
+
+            with path.open() as file:
+                from_file = deserialize_server_properties(file)
+
+        from_string = deserialize_server_properties(SERVER_PROPERTIES)
+        self.assertEqual(from_file, from_string)
+        self.assertEqual(list(from_file), list(from_string))
+
+    def test_string_and_lines_match_without_trailing_newline(self) -> None:
+        content = SERVER_PROPERTIES.rstrip("\n")
+        self.assertEqual(
+            deserialize_server_properties(content.splitlines()),
+            deserialize_server_properties(content),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import fcntl
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from fuji.servers import MinecraftServer, _pack_varint, _unpack_varint
+
+
+class VarIntTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        for value in (0, 1, 127, 128, 255, 25565, 2**31 - 1, -1, -(2**31)):
+            with self.subTest(value=value):
+                data = _pack_varint(value)
+                self.assertEqual(_unpack_varint(data, 0), (value, len(data)))
+
+    def test_known_encodings(self) -> None:
+        self.assertEqual(_pack_varint(0), b"\x00")
+        self.assertEqual(_pack_varint(300), b"\xac\x02")
+        self.assertEqual(_pack_varint(-1), b"\xff\xff\xff\xff\x0f")
+
+    def test_five_bytes(self) -> None:
+        self.assertEqual(len(_pack_varint(2**31 - 1)), 5)
+        self.assertEqual(len(_pack_varint(-1)), 5)
+
+    def test_offset(self) -> None:
+        data = b"\x00" + _pack_varint(300) + b"\x01"
+        self.assertEqual(_unpack_varint(data, 1), (300, 3))
+
+    def test_too_big(self) -> None:
+        with self.assertRaises(ValueError):
+            _unpack_varint(b"\xff" * 6, 0)
+
+    def test_truncated(self) -> None:
+        with self.assertRaises(IndexError):
+            _unpack_varint(b"\xff\xff", 0)
+
+
+class StatusTest(unittest.TestCase):
+    def test_without_server_properties(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            server = MinecraftServer(directory)
+
+            self.assertFalse(server.status())
+            self.assertEqual(
+                MinecraftServer.status_many([server]), {server.name: False}
+            )
+
+
+class CreateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        path = pathlib.Path(directory.name).joinpath("servers", "example")
+        self.server = MinecraftServer(str(path))
+
+        # Nothing is downloaded, and the server is never actually run.
+        for patch in (
+            mock.patch.object(MinecraftServer, "update"),
+            mock.patch("subprocess.run"),
+        ):
+            self.addCleanup(patch.stop)
+            patch.start()
+
+    def test_resumes_unfinished_setup(self) -> None:
+        with mock.patch("builtins.input", return_value="n"):
+            with self.assertRaises(RuntimeError):
+                self.server.create()
+
+        self.server.path.joinpath("server.properties").touch()
+        self.server.create(accept_eula=True)
+
+        eula = self.server.path.joinpath("eula.txt")
+        self.assertEqual(eula.read_text(), "eula=true")
+
+    def test_existing_server(self) -> None:
+        self.server.create(accept_eula=True)
+        self.server.path.joinpath("server.properties").touch()
+
+        with self.assertRaises(FileExistsError):
+            self.server.create(accept_eula=True)
+
+
+class PluginETagTest(unittest.TestCase):
+    url = "https://example.com/plugin.jar"
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        root = pathlib.Path(directory.name)
+        path = root.joinpath("servers", "example")
+        path.joinpath("plugins").mkdir(parents=True)
+
+        self.server = MinecraftServer(str(path))
+        self.plugin = path.joinpath("plugins", "plugin.jar")
+        self.plugin.write_bytes(b"plugin")
+        self.server._set_plugin_etag(self.plugin, self.url, '"abc"')
+
+    def test_unchanged(self) -> None:
+        etag = self.server._get_plugin_etag(self.plugin, self.url)
+        self.assertEqual(etag, '"abc"')
+
+    def test_different_url(self) -> None:
+        url = "https://example.com/other.jar"
+        self.assertIsNone(self.server._get_plugin_etag(self.plugin, url))
+
+    def test_size_changed(self) -> None:
+        st = self.plugin.stat()
+        self.plugin.write_bytes(b"modified plugin")
+        # Keep the modification time, so only the size differs.
+        os.utime(self.plugin, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertIsNone(self.server._get_plugin_etag(self.plugin, self.url))
+
+    def test_mtime_changed(self) -> None:
+        st = self.plugin.stat()
+        mtime = st.st_mtime_ns + 1_000_000_000
+        os.utime(self.plugin, ns=(st.st_atime_ns, mtime))
+
+        self.assertIsNone(self.server._get_plugin_etag(self.plugin, self.url))
+
+    def test_missing_plugin(self) -> None:
+        self.plugin.unlink()
+        self.assertIsNone(self.server._get_plugin_etag(self.plugin, self.url))
+
+    def test_missing_cache(self) -> None:
+        self.server._plugin_cache.unlink()
+        self.assertIsNone(self.server._get_plugin_etag(self.plugin, self.url))
+
+
+class LockTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        path = pathlib.Path(directory.name).joinpath("servers", "example")
+        path.mkdir(parents=True)
+        self.server = MinecraftServer(str(path))
+        self.addCleanup(self.server.unlock)
+
+    def test_lock_and_unlock(self) -> None:
+        self.assertFalse(self.server.is_locked())
+        self.server.lock()
+        self.assertTrue(self.server.is_locked())
+        self.assertEqual(self.server.lock_file.read_text(), str(os.getpid()))
+
+        self.server.unlock()
+        self.assertFalse(self.server.is_locked())
+
+    def test_only_one_holder(self) -> None:
+        # Each instance opens the file separately, like separate processes.
+        other = MinecraftServer(str(self.server.path))
+        self.addCleanup(other.unlock)
+        self.server.lock()
+
+        with self.assertRaises(RuntimeError):
+            other.lock()
+
+        self.server.unlock()
+        other.lock()
+        self.assertTrue(self.server.is_locked())
+
+    def test_empty_lock_file_is_held(self) -> None:
+        # Locked by another process that has not written its PID yet.
+        fd = os.open(self.server.lock_file, os.O_CREAT | os.O_EXCL, 0o644)
+        self.addCleanup(os.close, fd)
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        with self.assertRaises(RuntimeError):
+            self.server.lock()
+
+        self.assertEqual(self.server.lock_file.read_bytes(), b"")
+
+    def test_stale_lock_file_is_taken_over(self) -> None:
+        # Left behind by a process that exited while holding the lock.
+        self.server.lock_file.write_text("999999999")
+        self.assertFalse(self.server.is_locked())
+
+        self.server.lock()
+        self.assertEqual(self.server.lock_file.read_text(), str(os.getpid()))
+
+
+if __name__ == "__main__":
+    unittest.main()